@@ -1,113 +1,616 @@
+import functools
 import hashlib
+import heapq
+import json
+import os
+import struct
+import time
+import types
+from collections.abc import Mapping, Sequence, Set
 from datetime import datetime, date
 
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Receipt hash constructors, all producing 32-byte digests. hashlib's SHA-256 is
+# OpenSSL's, which already dispatches to SHA-NI at runtime on CPUs that have it.
+_HASH_ALGOS = {
+    "sha256": hashlib.sha256,
+    "blake2b": functools.partial(hashlib.blake2b, digest_size=32),
+}
+if blake3 is not None:
+    _HASH_ALGOS["blake3"] = blake3.blake3
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _canonical_json(obj):
+    # Compact, key-sorted JSON. For str/bool/None/list-of-str consents the stdlib fallback is
+    # byte-identical, so those receipts don't depend on orjson being installed. Other values
+    # (floats, big ints, NaN) may encode differently or be rejected; callers encode before
+    # changing any state, so a rejected value leaves the engine untouched.
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+
+
+# Fixed-width reuse log record: artifact idx, timestamp (ns since epoch), disclosed flag
+_REUSE_RECORD = struct.Struct("<qqB")
+_DIGEST_SIZE = 32
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NO_EXPIRY = 0x7FFFFFFF   # epoch-day sentinel for absent or unparseable expiry
+
+
+def _iso_second(unix_seconds):
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(unix_seconds))
+
+
+def _epoch_day(d):
+    return d.toordinal() - _EPOCH_ORDINAL
+
+
+def _parse_expiry(expires):
+    if not expires:
+        return _NO_EXPIRY
+    try:
+        return _epoch_day(datetime.fromisoformat(expires.split('T')[0]).date())
+    except (ValueError, TypeError, AttributeError):   # unparseable or not a string
+        return _NO_EXPIRY
+
+
+class Consent:
+    # Frozen once built: changes replace the instance, so receipt history can
+    # reference it as the snapshot without copying.
+    __slots__ = ("extractive", "expires", "scope", "expiry_epoch")
+
+    def __init__(self, extractive=False, expires=None, scope=None):
+        set_ = object.__setattr__
+        set_(self, "extractive", extractive)
+        set_(self, "expires", expires)
+        set_(self, "scope", () if scope is None else tuple(scope))
+        set_(self, "expiry_epoch", _parse_expiry(expires))   # last valid day, in days since 1970-01-01
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Consent is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Consent is immutable")
+
+    def __reduce__(self):
+        # copy/pickle would otherwise go through the blocked __setattr__
+        return (Consent, (self.extractive, self.expires, self.scope))
+
+    def __eq__(self, other):
+        if not isinstance(other, Consent):
+            return NotImplemented
+        return (self.extractive, self.expires, self.scope) == (other.extractive, other.expires, other.scope)
+
+    def __hash__(self):
+        return hash((self.extractive, self.expires, self.scope))
+
+    def as_dict(self):
+        return {"extractive": self.extractive, "expires": self.expires, "scope": list(self.scope)}
+
+
+_DEFAULT_CONSENT = Consent()   # shared by every newly registered user; safe because Consent is frozen
+
+
+def _merkle_split(n):
+    # Largest power of two strictly below n (RFC 6962 split point)
+    return 1 << ((n - 1).bit_length() - 1)
+
+
+def _merkle_subtree(hash_, nodes, lo, hi):
+    if hi - lo == 1:
+        return nodes[lo]
+    mid = lo + _merkle_split(hi - lo)
+    return hash_(b"\x01" + _merkle_subtree(hash_, nodes, lo, mid)
+                 + _merkle_subtree(hash_, nodes, mid, hi)).digest()
+
+
+def verify_inclusion_proof(proof):
+    # Checks a proof from get_inclusion_proof() against its root (RFC 9162, section 2.1.3.2)
+    hash_ = _HASH_ALGOS[proof["hash_algo"]]
+    index, size = proof["index"], proof["tree_size"]
+    if not 0 <= index < size:
+        return False
+    fn, sn = index, size - 1
+    node = hash_(b"\x00" + bytes.fromhex(proof["leaf"])).digest()
+    for sibling in map(bytes.fromhex, proof["path"]):
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            node = hash_(b"\x01" + sibling + node).digest()
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            node = hash_(b"\x01" + node + sibling).digest()
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and node.hex() == proof["root"]
+
+
+class _ReceiptAnchorView(Sequence):
+    # Read-only view of the anchor log: [{"receipt": str, "timestamp": str}] in issue order
+    __slots__ = ("_engine",)
+
+    def __init__(self, engine):
+        self._engine = engine
+
+    def __len__(self):
+        return len(self._engine._anchor_leaves) // _DIGEST_SIZE
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("receipt anchor index out of range")
+        engine = self._engine
+        start = index * _DIGEST_SIZE
+        digest = bytes(engine._anchor_leaves[start:start + _DIGEST_SIZE])
+        return {"receipt": engine._format_receipt(digest), "timestamp": engine._history_log[index][1]}
+
+
+class _KnownUsersView(Set):
+    # Read-only view of registered user ids
+    __slots__ = ("_engine",)
+
+    def __init__(self, engine):
+        self._engine = engine
+
+    def __contains__(self, user_id):
+        return user_id in self._engine._uid_to_idx
+
+    def __iter__(self):
+        return iter(self._engine._user_ids)
+
+    def __len__(self):
+        return len(self._engine._user_ids)
+
+
+class _ConsentView(Mapping):
+    # Read-only view: {user_id: {"extractive", "expires", "scope"}}
+    __slots__ = ("_engine",)
+
+    def __init__(self, engine):
+        self._engine = engine
+
+    def __getitem__(self, user_id):
+        engine = self._engine
+        idx = engine._uid_to_idx[user_id]
+        return types.MappingProxyType(engine._consents[idx].as_dict())
+
+    def __contains__(self, user_id):
+        return user_id in self._engine._uid_to_idx
+
+    def __iter__(self):
+        return iter(self._engine._user_ids)
+
+    def __len__(self):
+        return len(self._engine._user_ids)
+
+
+class _AttributionView(Mapping):
+    # Read-only view: {artifact_id: (origin_user_id, ...)} for artifacts with recorded origins
+    __slots__ = ("_engine",)
+
+    def __init__(self, engine):
+        self._engine = engine
+
+    def __getitem__(self, artifact_id):
+        engine = self._engine
+        idx = engine._aid_to_idx.get(artifact_id)
+        origins = engine._attribution.get(idx)
+        if origins is None:
+            raise KeyError(artifact_id)
+        return tuple(origins)
+
+    def __contains__(self, artifact_id):
+        engine = self._engine
+        return engine._aid_to_idx.get(artifact_id) in engine._attribution
+
+    def __iter__(self):
+        artifact_ids = self._engine._artifact_ids
+        return (artifact_ids[idx] for idx in self._engine._attribution)
+
+    def __len__(self):
+        return len(self._engine._attribution)
+
+
+class _ArtifactStateView(Mapping):
+    # Read-only view: {artifact_id: state} for artifacts with a lifecycle state
+    __slots__ = ("_engine",)
+
+    def __init__(self, engine):
+        self._engine = engine
+
+    def __getitem__(self, artifact_id):
+        engine = self._engine
+        idx = engine._aid_to_idx.get(artifact_id)
+        state = engine._artifact_states[idx] if idx is not None else None
+        if state is None:
+            raise KeyError(artifact_id)
+        return state
+
+    def __contains__(self, artifact_id):
+        engine = self._engine
+        idx = engine._aid_to_idx.get(artifact_id)
+        return idx is not None and engine._artifact_states[idx] is not None
+
+    def __iter__(self):
+        engine = self._engine
+        return (aid for aid, state in zip(engine._artifact_ids, engine._artifact_states)
+                if state is not None)
+
+    def __len__(self):
+        return sum(self._engine._state_counts.values())
+
+
+def _payload_bytes(payload):
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return payload
+    if isinstance(payload, str):
+        return payload.encode()
+    try:
+        return _canonical_json(payload)
+    except (TypeError, ValueError):   # unencodable types, circular containers
+        return str(payload).encode()
+
+
 class ReciprocalTruthEnforcer:
-    def __init__(self):
-        self.consent = {}          # user_id -> {"extractive": bool, "expires": str|None, "scope": list[str]}
-        self.receipts = {}         # user_id -> list[{"timestamp": str, "receipt": str, "snapshot": dict}]
-        self.receipt_anchor = []   # global immutable log: [{"receipt": str, "timestamp": str}]
-        self.attribution = {}      # artifact_id -> list[origin_user_id]
-        self.artifact_state = {}   # artifact_id -> str: "generated" | "used" | "published" | "archived"
-        self.reuse_log = []        # list of {"artifact_id": str, "disclosed": bool, "timestamp": str}
-        self.known_users = set()
+    def __init__(self, hash_algo="sha256"):
+        if hash_algo == "blake3" and blake3 is None:
+            raise ValueError("hash_algo 'blake3' requires the blake3 package")
+        if hash_algo not in _HASH_ALGOS:
+            raise ValueError(f"Unsupported hash_algo: {hash_algo}")
+        self.hash_algo = hash_algo
+        self._hash = _HASH_ALGOS[hash_algo]
+        # SHA-256 receipts stay bare hex for compliance users; others are tagged "algo:digest"
+        self._receipt_prefix = "" if hash_algo == "sha256" else f"{hash_algo}:"
+
+        # Users and artifacts are interned to dense int indexes; string ids stay at the API boundary
+        self._uid_to_idx = {}      # user_id -> idx
+        self._user_ids = []        # idx -> user_id
+        self._consents = []        # idx -> Consent
+        self._latest_receipt = []  # idx -> most recent raw receipt digest, or None
+        self._history_log = []     # append-only: [(user_idx, timestamp, digest, Consent)]
+        # Global receipt anchor: Merkle accumulator over every receipt digest (RFC 6962 hashing)
+        self._anchor_leaves = bytearray()   # concatenated 32-byte receipt digests, in issue order
+        self._anchor_peaks = []    # level -> root of a full 2**level-leaf subtree, or None
+        self._anchor_root = None   # cached hex root; cleared whenever a leaf is added
+        self._aid_to_idx = {}      # artifact_id -> idx
+        self._artifact_ids = []    # idx -> artifact_id
+        self._artifact_states = [] # idx -> "generated" | "used" | "published" | "archived", or None
+        self._attribution = {}     # artifact idx -> {origin_user_id: None} (insertion-ordered set)
+        self._reuse_buf = bytearray()   # append-only _REUSE_RECORD entries; see reuse_log
         self.extractive_ingests = 0
         self.published_count = 0   # ever reached "published" state (for accurate RIM-6)
+        self._silent_reuses = 0    # reuse_log entries with disclosed=False
+        self._state_counts = {"generated": 0, "used": 0, "published": 0, "archived": 0}
+        self._ts_cache = (0, "")   # (unix second, UTC ISO string for that second)
+        self._artifact_seq = 0     # per-engine counter mixed into artifact ids
+        self._artifact_salt = os.urandom(16)          # keeps ids distinct across engines and restarts
+
+        # Incremental audit index; expired users are purged lazily by audit()
+        self._active_extractive = set()    # user idxs with active opt-in consent
+        self._active_with_expiry = set()   # ... that also carry an "expires" value
+        self._active_with_scope = set()    # ... that also carry a non-empty scope
+        self._expiry_heap = []             # min-heap of (expiry_epoch, seq, user_idx); stale entries skipped on pop
+        self._expiry_seq = 0               # next heap tie-breaker
+        self._expiry_seq_of = {}           # user_idx -> seq of its one live heap entry
 
     def register_user(self, user_id):
-        self.known_users.add(user_id)
-        if user_id not in self.consent:
-            self.consent[user_id] = {"extractive": False, "expires": None, "scope": []}
-        if user_id not in self.receipts:
-            self.receipts[user_id] = []
-
-    def _generate_consent_receipt(self, user_id):
-        consent_obj = self.consent[user_id]
-        payload = f"{user_id}|{str(consent_obj)}".encode()
-        receipt = hashlib.sha256(payload).hexdigest()
-        record = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "receipt": receipt,
-            "snapshot": consent_obj.copy()
+        self._register(user_id)
+
+    def _register(self, user_id):
+        idx = self._uid_to_idx.get(user_id)
+        if idx is None:
+            idx = self._uid_to_idx[user_id] = len(self._user_ids)
+            self._user_ids.append(user_id)
+            self._consents.append(_DEFAULT_CONSENT)
+            self._latest_receipt.append(None)
+        return idx
+
+    def _intern_artifact(self, artifact_id):
+        idx = self._aid_to_idx.get(artifact_id)
+        if idx is None:
+            idx = self._aid_to_idx[artifact_id] = len(self._artifact_ids)
+            self._artifact_ids.append(artifact_id)
+            self._artifact_states.append(None)
+        return idx
+
+    def _now_iso(self):
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, _iso_second(now))
+        return self._ts_cache[1]
+
+    def _consent_payload(self, user_id, consent):
+        return str(user_id).encode() + b"|" + _canonical_json(consent.as_dict())
+
+    def _format_receipt(self, digest):
+        # Receipts are kept as raw digests; hex (and the algorithm tag) only at the API boundary
+        return self._receipt_prefix + digest.hex()
+
+    def _record_receipt(self, idx, digest, timestamp, snapshot):
+        self._latest_receipt[idx] = digest
+        self._history_log.append((idx, timestamp, digest, snapshot))
+        self._anchor(digest)
+
+    def _anchor(self, digest):
+        hash_ = self._hash
+        self._anchor_leaves += digest
+        self._anchor_root = None
+        node = hash_(b"\x00" + digest).digest()
+        peaks = self._anchor_peaks
+        level = 0
+        while level < len(peaks) and peaks[level] is not None:
+            node = hash_(b"\x01" + peaks[level] + node).digest()
+            peaks[level] = None
+            level += 1
+        if level == len(peaks):
+            peaks.append(node)
+        else:
+            peaks[level] = node
+
+    def get_anchor_root(self):
+        if self._anchor_root is None and self._anchor_leaves:
+            root = None
+            for peak in self._anchor_peaks:  # smallest subtree first; it sits rightmost in the tree
+                if peak is not None:
+                    root = peak if root is None else self._hash(b"\x01" + peak + root).digest()
+            self._anchor_root = root.hex()
+        return self._anchor_root
+
+    @property
+    def receipt_anchor(self):
+        return _ReceiptAnchorView(self)
+
+    def get_inclusion_proof(self, index):
+        # Audit path proving the index-th anchored receipt is under the current root
+        leaves = self._anchor_leaves
+        size = len(leaves) // _DIGEST_SIZE
+        if not 0 <= index < size:
+            raise IndexError(f"No anchored receipt at index {index}")
+        hash_ = self._hash
+        nodes = [hash_(b"\x00" + leaves[i:i + _DIGEST_SIZE]).digest()
+                 for i in range(0, len(leaves), _DIGEST_SIZE)]
+        path = []
+        lo, hi = 0, size
+        while hi - lo > 1:
+            mid = lo + _merkle_split(hi - lo)
+            if index < mid:
+                path.append(_merkle_subtree(hash_, nodes, mid, hi))
+                hi = mid
+            else:
+                path.append(_merkle_subtree(hash_, nodes, lo, mid))
+                lo = mid
+        path.reverse()   # leaf-level sibling first, as RFC 6962 orders the audit path
+        return {
+            "hash_algo": self.hash_algo,
+            "index": index,
+            "tree_size": size,
+            "leaf": leaves[index * _DIGEST_SIZE:(index + 1) * _DIGEST_SIZE].hex(),
+            "path": [p.hex() for p in path],
+            "root": self.get_anchor_root()
         }
-        self.receipts[user_id].append(record)
 
-        # Global receipt anchor log (immutable public ledger of all consent changes)
-        self.receipt_anchor.append({
-            "receipt": receipt,
-            "timestamp": record["timestamp"]
-        })
+    def _build_consent(self, user_id, extractive=True, expires=None, scope=None):
+        # Validates and serializes before any engine state changes, so a bad update leaves nothing behind
+        consent = Consent(extractive, expires, scope)
+        return consent, self._consent_payload(user_id, consent)
+
+    def _receipted_consent(self, user_id):
+        # Current consent if it already has a receipt; an identical update to it is a no-op
+        idx = self._uid_to_idx.get(user_id)
+        if idx is None or self._latest_receipt[idx] is None:
+            return None
+        return self._consents[idx]
+
+    def _commit_consent(self, idx, consent, digest, timestamp):
+        self._consents[idx] = consent
+        self._index_consent(idx)
+        self._record_receipt(idx, digest, timestamp, consent)
+
+    def _unindex_consent(self, idx):
+        self._active_extractive.discard(idx)
+        self._active_with_expiry.discard(idx)
+        self._active_with_scope.discard(idx)
+        self._expiry_seq_of.pop(idx, None)
+
+    def _index_consent(self, idx):
+        c = self._consents[idx]
+        self._unindex_consent(idx)
+        if not self._is_active(idx):
+            return
+        self._active_extractive.add(idx)
+        if c.expires is not None:
+            self._active_with_expiry.add(idx)
+            if c.expiry_epoch != _NO_EXPIRY:
+                self._push_expiry(idx, c.expiry_epoch)
+        if len(c.scope) > 0:
+            self._active_with_scope.add(idx)
+
+    def _push_expiry(self, idx, expiry_epoch):
+        seq = self._expiry_seq
+        self._expiry_seq = seq + 1
+        self._expiry_seq_of[idx] = seq
+        heap = self._expiry_heap
+        heapq.heappush(heap, (expiry_epoch, seq, idx))
+        # Compact once superseded entries outnumber live ones (at most one live entry per user)
+        seq_of = self._expiry_seq_of
+        if len(heap) > 2 * len(seq_of) + 64:
+            self._expiry_heap = [e for e in heap if seq_of.get(e[2]) == e[1]]
+            heapq.heapify(self._expiry_heap)
 
-        return receipt
+    def _purge_expired(self, today_epoch):
+        heap = self._expiry_heap
+        seq_of = self._expiry_seq_of
+        while heap and heap[0][0] < today_epoch:
+            _, seq, idx = heapq.heappop(heap)
+            if seq_of.get(idx) == seq:
+                self._unindex_consent(idx)
 
     def set_consent(self, user_id, extractive=True, expires=None, scope=None):
-        self.register_user(user_id)
-        if scope is None:
-            scope = []
-        self.consent[user_id] = {
-            "extractive": extractive,
-            "expires": expires,
-            "scope": scope
-        }
-        return self._generate_consent_receipt(user_id)
+        # Idempotent: re-setting the current consent returns its existing receipt
+        consent, payload = self._build_consent(user_id, extractive, expires, scope)
+        if consent == self._receipted_consent(user_id):
+            return self._format_receipt(self._latest_receipt[self._uid_to_idx[user_id]])
+        idx = self._register(user_id)
+        digest = self._hash(payload).digest()
+        self._commit_consent(idx, consent, digest, self._now_iso())
+        return self._format_receipt(digest)
+
+    def set_consent_bulk(self, entries):
+        # entries: iterable of (user_id, extractive, expires, scope) tuples, trailing
+        # fields optional as in set_consent. Every entry is validated and serialized
+        # before anything is stored, so a bad entry leaves the engine untouched. Payloads
+        # are then hashed in one pass and committed in order under a shared timestamp.
+        # Unchanged entries, compared against what earlier entries in the batch staged,
+        # are not hashed and return the user's existing receipt, as in set_consent.
+        staged = []
+        batch = {}   # user_id -> consent staged by an earlier entry in this batch
+        for entry in entries:
+            user_id = entry[0]
+            consent, payload = self._build_consent(*entry)
+            previous = batch[user_id] if user_id in batch else self._receipted_consent(user_id)
+            if consent == previous:
+                payload = None
+            else:
+                batch[user_id] = consent
+            staged.append((user_id, consent, payload))
+
+        hash_ = self._hash
+        digests = [hash_(payload).digest() if payload is not None else None
+                   for _, _, payload in staged]
+
+        timestamp = self._now_iso()
+        receipts = []
+        for (user_id, consent, _), digest in zip(staged, digests):
+            idx = self._register(user_id)
+            if digest is None:
+                digest = self._latest_receipt[idx]
+            else:
+                self._commit_consent(idx, consent, digest, timestamp)
+            receipts.append(self._format_receipt(digest))
+        return receipts
 
     def revoke_consent(self, user_id):
-        self.register_user(user_id)
-        if user_id in self.consent:
-            self.consent[user_id]["extractive"] = False
-        return self._generate_consent_receipt(user_id)
+        # Idempotent: revoking an already non-extractive, receipted consent returns its existing receipt
+        idx = self._register(user_id)
+        c = self._consents[idx]
+        if not c.extractive and self._latest_receipt[idx] is not None:
+            return self._format_receipt(self._latest_receipt[idx])
+        consent = Consent(False, c.expires, c.scope)
+        digest = self._hash(self._consent_payload(user_id, consent)).digest()
+        self._commit_consent(idx, consent, digest, self._now_iso())
+        return self._format_receipt(digest)
 
     def get_latest_receipt(self, user_id):
-        if user_id not in self.receipts or not self.receipts[user_id]:
-            return None
-        return self.receipts[user_id][-1]["receipt"]
+        idx = self._uid_to_idx.get(user_id)
+        digest = self._latest_receipt[idx] if idx is not None else None
+        return self._format_receipt(digest) if digest is not None else None
 
     def get_consent_history(self, user_id):
-        return self.receipts.get(user_id, [])
+        idx = self._uid_to_idx.get(user_id)
+        if idx is None:
+            return []
+        return [
+            {"timestamp": timestamp, "receipt": self._format_receipt(digest), "snapshot": snapshot.as_dict()}
+            for uidx, timestamp, digest, snapshot in self._history_log
+            if uidx == idx
+        ]
 
-    def is_active_extractive(self, user_id):
-        if user_id not in self.consent:
-            return False
-        c = self.consent[user_id]
-        if not c.get("extractive", False):
+    def get_consent(self, user_id):
+        idx = self._uid_to_idx.get(user_id)
+        return self._consents[idx].as_dict() if idx is not None else None
+
+    @property
+    def consent(self):
+        return _ConsentView(self)
+
+    @property
+    def known_users(self):
+        return _KnownUsersView(self)
+
+    def is_active_extractive(self, user_id, today=None):
+        idx = self._uid_to_idx.get(user_id)
+        if idx is None:
             return False
-        expires = c.get("expires")
-        if expires:
-            try:
-                expiry_date = datetime.fromisoformat(expires.split('T')[0]).date()
-                if date.today() > expiry_date:
-                    return False
-            except ValueError:
-                pass
-        return True
+        return self._is_active(idx, _epoch_day(today) if today is not None else None)
+
+    def _is_active(self, idx, today_epoch=None):
+        c = self._consents[idx]
+        if today_epoch is None:
+            today_epoch = _epoch_day(date.today())
+        return c.extractive and today_epoch <= c.expiry_epoch
 
     def ingest(self, user_id, payload, extractive=False, required_scopes=None):
-        self.register_user(user_id)
+        idx = self._register(user_id)
         if required_scopes is None:
             required_scopes = []
 
         if extractive or required_scopes:
-            if not self.is_active_extractive(user_id):
+            if not self._is_active(idx):
                 raise PermissionError("Extractive use or scoped access requires active opt-in consent")
             
             if required_scopes:
-                consent_scope = set(self.consent[user_id].get("scope", []))
+                consent_scope = set(self._consents[idx].scope)
                 if not set(required_scopes) <= consent_scope:
                     raise PermissionError("Required scopes not covered by user consent")
 
-        artifact_id = f"artifact_{hash(str(payload) + str(datetime.utcnow()))}"
+        if not extractive:
+            return {"status": "Processed", "artifact_id": None}
 
-        if extractive:
-            self.extractive_ingests += 1
-            self.record_derivative(artifact_id, user_id)
-            self.artifact_state[artifact_id] = "generated"
+        seq = self._artifact_seq
+        self._artifact_seq = seq + 1
+        h = self._hash(self._artifact_salt + seq.to_bytes(8, "big"))
+        h.update(_payload_bytes(payload))
+        artifact_id = f"artifact_{h.digest()[:16].hex()}"
 
-        return {"status": "Processed", "artifact_id": artifact_id if extractive else None}
+        self.extractive_ingests += 1
+        self.record_derivative(artifact_id, user_id)
+        self._set_artifact_state(self._aid_to_idx[artifact_id], "generated")
+
+        return {"status": "Processed", "artifact_id": artifact_id}
 
     def record_derivative(self, artifact_id, origin_user):
-        if artifact_id not in self.attribution:
-            self.attribution[artifact_id] = []
-        if origin_user not in self.attribution[artifact_id]:
-            self.attribution[artifact_id].append(origin_user)
+        idx = self._intern_artifact(artifact_id)
+        self._attribution.setdefault(idx, {})[origin_user] = None
+
+    def get_attribution(self, artifact_id):
+        idx = self._aid_to_idx.get(artifact_id)
+        return list(self._attribution.get(idx, ()))
+
+    def get_artifact_state(self, artifact_id):
+        idx = self._aid_to_idx.get(artifact_id)
+        return self._artifact_states[idx] if idx is not None else None
+
+    @property
+    def attribution(self):
+        return _AttributionView(self)
+
+    @property
+    def artifact_state(self):
+        return _ArtifactStateView(self)
+
+    def _set_artifact_state(self, idx, new_state):
+        current = self._artifact_states[idx]
+        if current is not None:
+            self._state_counts[current] -= 1
+        self._state_counts[new_state] += 1
+        self._artifact_states[idx] = new_state
 
     def transition_artifact_state(self, artifact_id, new_state):
         valid_transitions = {
@@ -116,7 +619,8 @@ class ReciprocalTruthEnforcer:
             "published": ["archived"],
             "archived": []
         }
-        current = self.artifact_state.get(artifact_id, None)
+        idx = self._aid_to_idx.get(artifact_id)
+        current = self._artifact_states[idx] if idx is not None else None
         if current is None:
             raise ValueError(f"Artifact {artifact_id} not found")
         if new_state not in valid_transitions.get(current, []):
@@ -126,49 +630,50 @@ class ReciprocalTruthEnforcer:
         if new_state == "published":
             self.published_count += 1
 
-        self.artifact_state[artifact_id] = new_state
+        self._set_artifact_state(idx, new_state)
 
     def log_reuse(self, artifact_id, disclosed=False):
-        if artifact_id in self.artifact_state:
-            if self.artifact_state[artifact_id] in ["generated", "used"]:
-                self.artifact_state[artifact_id] = "used"
-        self.reuse_log.append({
-            "artifact_id": artifact_id,
-            "disclosed": disclosed,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        idx = self._intern_artifact(artifact_id)
+        if self._artifact_states[idx] == "generated":
+            self._set_artifact_state(idx, "used")
+        self._reuse_buf += _REUSE_RECORD.pack(idx, time.time_ns(), 1 if disclosed else 0)
+        if not disclosed:
+            self._silent_reuses += 1
+
+    @property
+    def reuse_log(self):
+        # List view over the binary log: [{"artifact_id": str, "disclosed": bool, "timestamp": str}]
+        artifact_ids = self._artifact_ids
+        return [
+            {"artifact_id": artifact_ids[idx], "disclosed": bool(flags),
+             "timestamp": _iso_second(ts // 1_000_000_000)}
+            for idx, ts, flags in _REUSE_RECORD.iter_unpack(self._reuse_buf)
+        ]
 
     def audit(self):
-        total_users = len(self.known_users)
-        
-        active_consenting = sum(1 for uid in self.known_users if self.is_active_extractive(uid))
+        total_users = len(self._user_ids)
+        self._purge_expired(_epoch_day(date.today()))
+
+        active_consenting = len(self._active_extractive)
         rim_1 = round(active_consenting / total_users, 4) if total_users > 0 else 0.0
 
-        attributed_artifacts = len(self.attribution)
+        attributed_artifacts = len(self._attribution)
         rim_2 = round(attributed_artifacts / self.extractive_ingests, 4) if self.extractive_ingests > 0 else 0.0
 
-        total_reuses = len(self.reuse_log)
-        silent_reuses = len([r for r in self.reuse_log if not r["disclosed"]])
+        total_reuses = len(self._reuse_buf) // _REUSE_RECORD.size
+        silent_reuses = self._silent_reuses
         disclosed_rate = (total_reuses - silent_reuses) / total_reuses if total_reuses > 0 else 1.0
         rim_3 = round(disclosed_rate, 4)
 
-        exp_count = sum(1 for uid in self.known_users 
-                       if self.is_active_extractive(uid) and self.consent[uid].get("expires") is not None)
+        exp_count = len(self._active_with_expiry)
         rim_4 = round(exp_count / active_consenting, 4) if active_consenting > 0 else 0.0
 
-        scope_count = sum(1 for uid in self.known_users 
-                         if self.is_active_extractive(uid) and len(self.consent[uid].get("scope", [])) > 0)
+        scope_count = len(self._active_with_scope)
         rim_5 = round(scope_count / active_consenting, 4) if active_consenting > 0 else 0.0
 
         total_generated = self.extractive_ingests
         rim_6 = round(self.published_count / total_generated, 4) if total_generated > 0 else 0.0
 
-        # Artifact lifecycle stats
-        state_counts = {"generated": 0, "used": 0, "published": 0, "archived": 0}
-        for state in self.artifact_state.values():
-            if state in state_counts:
-                state_counts[state] += 1
-
         return {
             # Direct RIM emissions
             "RIM-1": rim_1,
@@ -186,7 +691,8 @@ class ReciprocalTruthEnforcer:
             "attributed_artifacts": attributed_artifacts,
             "total_reuses": total_reuses,
             "silent_reuses": silent_reuses,
-            "artifact_states": state_counts,
-            "total_receipts_issued": sum(len(v) for v in self.receipts.values()),
-            "anchored_receipts": len(self.receipt_anchor)
+            "artifact_states": dict(self._state_counts),
+            "total_receipts_issued": len(self._history_log),
+            "anchored_receipts": len(self._anchor_leaves) // _DIGEST_SIZE,
+            "anchored_root": self.get_anchor_root()
         }